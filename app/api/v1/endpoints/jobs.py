@@ -11,7 +11,7 @@ from app.jobs.request_union import JobRequest
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(tags=["jobs"])
 
 
 @router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
@@ -82,34 +82,53 @@ async def submit_job(
         response.headers["X-Idempotent-Replay"] = "true"
 
     logger.info(
-        f"Job {job_id} {'submitted' if is_new else 'returned (idempotent)'} "
-        f"successfully, Location: {location}"
+        "Job %s %s successfully, Location: %s",
+        job_id,
+        "submitted" if is_new else "returned (idempotent)",
+        location,
     )
 
     return job_response
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: str) -> JobResponse:
+async def get_job_status(
+    job_id: str,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> JobResponse | Response:
     """Get the status and results of a job.
 
+    Responses carry a weak ETag derived from the job's state version. Clients
+    polling with `If-None-Match` get an empty 304 while nothing has changed.
+
     Args:
         job_id: The unique job identifier
+        response: FastAPI response object (for setting headers)
+        if_none_match: Optional ETag(s) from a previous response
 
     Returns:
-        JobResponse with current status, intermediate results, and final result
+        JobResponse with current status, intermediate results, and final result,
+        or an empty 304 response if the job is unchanged
 
     Raises:
         HTTPException: If job not found
     """
-    job_response = job_manager.get_job_response(job_id)
+    job = job_manager.get_job(job_id)
 
-    if not job_response:
+    if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found"
         )
 
-    return job_response
+    # Clients should always revalidate, but may reuse their copy on 304
+    headers = {"ETag": job.etag, "Cache-Control": "no-cache"}
+
+    if if_none_match and _etag_matches(if_none_match, job.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return job.to_response()
 
 
 @router.get("/jobs", response_model=dict)
@@ -124,3 +143,22 @@ async def get_queue_info() -> dict:
         "queue_size": job_manager.get_queue_size(),
         "available_job_types": list_handlers(),
     }
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: The current ETag
+
+    Returns:
+        True if any of the listed ETags matches; false otherwise
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == current for tag in if_none_match.split(",")
+    )
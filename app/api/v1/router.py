@@ -2,6 +2,10 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import jobs
 
-api_router = APIRouter()
-
-api_router.include_router(jobs.router, tags=["jobs"])
+# Merge endpoint routes directly instead of include_router, which rebuilds every
+# route (and its dependency tree) once more; tags are set on each endpoint router
+api_router = APIRouter(
+    routes=[
+        *jobs.router.routes,
+    ]
+)
@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -30,6 +28,7 @@ class Settings(BaseSettings):
     job_workers: int = 10  # Background async job queue workers
     job_retention_seconds: int = 3600  # Keep completed jobs for 1 hour (3600s)
     job_cleanup_interval_seconds: int = 300  # Run cleanup every 5 minutes (300s)
+    max_intermediate_results: int = 1024  # Keep only the latest N results per job
 
     # Logging
     log_level: str = "INFO"
@@ -39,7 +38,10 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+# Settings are read-only at runtime, so load them once at import
+_settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return _settings
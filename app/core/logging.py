@@ -1,24 +1,60 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Logging format
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def setup_logging(log_level: str = "INFO") -> None:
-    """Configure application logging."""
+    """Configure application logging.
+
+    The calling code still formats each record (merging message and args,
+    rendering tracebacks) before enqueueing it; only writing to the stream
+    happens on a background listener thread, so request handling never
+    blocks on output I/O.
+    """
+
+    # Output handler, driven by the listener thread
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
 
-    # Configure logging format
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
 
-    # Configure root logger
+    # Configure root logger (the queue handler only merges message and args)
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        datefmt=date_format,
+        format="%(message)s",
+        handlers=[queue_handler],
     )
 
+    # Only start the listener if basicConfig actually installed our handler
+    if queue_handler in logging.getLogger().handlers:
+        listener = QueueListener(log_queue, console_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
+def setup_process_logging(log_level: str = "INFO") -> None:
+    """Configure logging in a process pool worker.
+
+    Used as the pool's initializer. Worker processes don't share the parent's
+    queue listener, so they write their records to the stream directly.
+    """
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper()),
+        format=LOG_FORMAT,
+        datefmt=DATE_FORMAT,
+        force=True,  # Replace any handlers inherited from the parent
+    )
+
+
 # Create a logger instance for the application
 logger = logging.getLogger("fastapi_app")
@@ -1,7 +1,22 @@
-import base64
-import uuid
+import secrets
+from typing import Any
 
 
-def create_id():
-    random_bytes = uuid.uuid4().bytes
-    return base64.urlsafe_b64encode(random_bytes).decode("ascii").rstrip("=")
+def create_id() -> str:
+    # 16 random bytes as unpadded base64url (22 chars), without building a UUID object
+    return secrets.token_urlsafe(16)
+
+
+def freeze(value: Any) -> Any:
+    """Build a hashable key for a (nested) value made of dicts, lists and sets.
+
+    Types are part of the key, so e.g. 1, 1.0 and True stay distinct.
+    Hashing the result raises TypeError if a leaf value is unhashable.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(freeze(item) for item in value)
+    return type(value), value
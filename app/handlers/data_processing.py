@@ -11,6 +11,12 @@ from app.jobs.schemas import BaseJobRequest
 
 logger = logging.getLogger(__name__)
 
+# Report processing progress once per this many completed items
+PROGRESS_CHUNK = 10
+
+# Same "finalization started" entry for every job; the dict is never mutated
+_FINALIZATION_STARTED = {"step": "finalization", "status": "started"}
+
 
 class DataProcessingRequest(BaseJobRequest):
     """Request for data processing job."""
@@ -20,9 +26,12 @@ class DataProcessingRequest(BaseJobRequest):
     delay: float = Field(
         default=1.0, ge=0, description="Delay between steps in seconds"
     )
+    concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of items processed at once"
+    )
 
 
-@register_handler("data_processing")
+@register_handler("data_processing", pure=True)
 async def process_data_handler(payload: dict[str, Any], context: JobContext) -> dict:
     """Example handler that processes data in multiple steps.
 
@@ -40,36 +49,44 @@ async def process_data_handler(payload: dict[str, Any], context: JobContext) ->
 
     items = data.items
     delay = data.delay
+    total = len(items)
 
-    logger.info(f"Starting data processing for {len(items)} items")
+    logger.info("Starting data processing for %d items", total)
 
     # Step 1: Validation
     context.add_result(
-        {"step": "validation", "status": "started", "total_items": len(items)}
+        {"step": "validation", "status": "started", "total_items": total}
     )
     await asyncio.sleep(delay)
     context.add_result(
-        {"step": "validation", "status": "completed", "valid_items": len(items)}
+        {"step": "validation", "status": "completed", "valid_items": total}
     )
 
-    # Step 2: Processing each item
-    processed_items = []
-    for i, item in enumerate(items):
-        await asyncio.sleep(delay)
-        processed_item = str(item).upper()
-        processed_items.append(processed_item)
-
-        # Report progress
-        context.add_result(
-            {
-                "step": "processing",
-                "progress": f"{i + 1}/{len(items)}",
-                "current_item": processed_item,
-            }
-        )
+    # Step 2: Wait for per-item work concurrently, at most `concurrency` at a time
+    semaphore = asyncio.Semaphore(data.concurrency)
+    completed = 0
+
+    async def process_item() -> None:
+        nonlocal completed
+
+        async with semaphore:
+            await asyncio.sleep(delay)
+
+        completed += 1
+
+        # Report progress per chunk rather than per item
+        if completed % PROGRESS_CHUNK == 0 or completed == total:
+            context.add_result(
+                {"step": "processing", "progress": f"{completed}/{total}"}
+            )
+
+    await asyncio.gather(*(process_item() for _ in range(total)))
+
+    # Transform all items in one pass
+    processed_items = [item.upper() for item in items]
 
     # Step 3: Finalization
-    context.add_result({"step": "finalization", "status": "started"})
+    context.add_result(_FINALIZATION_STARTED)
     await asyncio.sleep(delay)
 
     # Return final result
@@ -11,6 +11,9 @@ from app.jobs.schemas import BaseJobRequest
 
 logger = logging.getLogger(__name__)
 
+# Same "processing" entry for every echo job
+_PROCESSING_RESULT = {"status": "processing", "message": "Echoing payload"}
+
 
 class EchoRequest(BaseJobRequest):
     """Request for echo job."""
@@ -22,7 +25,7 @@ class EchoRequest(BaseJobRequest):
     )
 
 
-@register_handler("echo")
+@register_handler("echo", pure=True)
 async def echo_handler(payload: dict[str, Any], context: JobContext) -> dict:
     """Simple echo handler that returns the payload.
 
@@ -38,9 +41,9 @@ async def echo_handler(payload: dict[str, Any], context: JobContext) -> dict:
     # Validate payload into typed request
     data = EchoRequest(**payload)
 
-    logger.info(f"Echo handler invoked with message: {data.message}")
+    logger.info("Echo handler invoked with message: %s", data.message)
 
-    context.add_result({"status": "processing", "message": "Echoing payload"})
+    context.add_result(_PROCESSING_RESULT)
     await asyncio.sleep(0.5)
 
     return {
@@ -38,19 +38,22 @@ async def long_running_handler(payload: dict[str, Any], context: JobContext) ->
     stages = data.stages
     stage_duration = duration / stages
 
-    logger.info(f"Starting long-running job: {duration}s across {stages} stages")
-
-    for stage in range(1, stages + 1):
-        context.add_result(
-            {
-                "stage": stage,
-                "total_stages": stages,
-                "progress_percent": int((stage / stages) * 100),
-                "status": "running",
-            }
+    logger.info("Starting long-running job: %ss across %d stages", duration, stages)
+
+    # Report each stage from a timer callback and sleep once for the whole job,
+    # instead of waking this coroutine up once per stage
+    loop = asyncio.get_running_loop()
+    handles = [
+        loop.call_later(
+            (stage - 1) * stage_duration, context.set_progress, stage, stages
         )
-
-        await asyncio.sleep(stage_duration)
+        for stage in range(1, stages + 1)
+    ]
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        for handle in handles:
+            handle.cancel()
 
     return {
         "status": "success",
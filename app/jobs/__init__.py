@@ -1,7 +1,13 @@
 from app.jobs.base import JobContext
 from app.jobs.manager import JobManager, job_manager
 from app.jobs.registry import get_handler, list_handlers, register_handler
-from app.jobs.schemas import BaseJobRequest, IntermediateResult, JobResponse, JobStatus
+from app.jobs.schemas import (
+    BaseJobRequest,
+    IntermediateResult,
+    JobProgress,
+    JobResponse,
+    JobStatus,
+)
 from app.jobs.worker import start_workers, stop_workers
 
 __all__ = [
@@ -9,6 +15,7 @@ __all__ = [
     "IntermediateResult",
     "JobContext",
     "JobManager",
+    "JobProgress",
     "JobResponse",
     "JobStatus",
     "get_handler",
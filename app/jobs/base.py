@@ -1,8 +1,15 @@
+import asyncio
 import logging
+import time
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Intermediate results are published to the job in batches of this size, or at
+# the latest this many seconds after the first buffered result
+RESULT_BATCH_SIZE = 16
+RESULT_FLUSH_DELAY = 0.1
+
 
 class JobContext:
     """Context object passed to handlers for updating job state."""
@@ -16,11 +23,46 @@ class JobContext:
         """
         self.job_id = job_id
         self._job_manager = job_manager
+        self._publish = job_manager.add_intermediate_results  # bound once per job
+        self._pending: list[tuple[float, Any]] = []  # (timestamp, data)
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     def add_result(self, data: Any) -> None:
         """Add an intermediate result to the job.
 
+        Results are buffered and published in batches, so they become visible
+        to clients shortly after being added (see RESULT_FLUSH_DELAY).
+
         Args:
             data: The intermediate result data to add
         """
-        self._job_manager.add_intermediate_result(self.job_id, data)
+        self._pending.append((time.time(), data))
+
+        if len(self._pending) >= RESULT_BATCH_SIZE:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                RESULT_FLUSH_DELAY, self.flush
+            )
+
+    def set_progress(self, current: int, total: int) -> None:
+        """Report the job's progress.
+
+        Unlike intermediate results, progress is a single value that is
+        overwritten on every call and visible to clients immediately.
+
+        Args:
+            current: Completed units of work
+            total: Total units of work
+        """
+        self._job_manager.set_job_progress(self.job_id, current, total)
+
+    def flush(self) -> None:
+        """Publish all buffered intermediate results to the job."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._pending:
+            self._publish(self.job_id, self._pending)
+            self._pending = []
@@ -19,7 +19,9 @@ async def cleanup_loop(
         interval_seconds: How often to run cleanup (in seconds)
     """
     logger.info(
-        f"Cleanup task started: retention={retention_seconds}s, interval={interval_seconds}s"
+        "Cleanup task started: retention=%ss, interval=%ss",
+        retention_seconds,
+        interval_seconds,
     )
 
     try:
@@ -33,14 +35,14 @@ async def cleanup_loop(
             # Log stats
             total_jobs = job_manager.get_job_count()
             logger.debug(
-                f"Cleanup cycle: removed {removed} jobs, {total_jobs} jobs remaining"
+                "Cleanup cycle: removed %d jobs, %d jobs remaining", removed, total_jobs
             )
 
     except asyncio.CancelledError:
         logger.info("Cleanup task shutting down")
         raise
     except Exception as e:
-        logger.exception(f"Cleanup task encountered error: {e}")
+        logger.exception("Cleanup task encountered error: %s", e)
         raise
 
 
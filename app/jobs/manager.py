@@ -1,22 +1,86 @@
 """In-memory job queue manager."""
 
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+import sys
+import time
+from collections import OrderedDict, deque
+from collections.abc import Hashable, Iterable
+from datetime import datetime
 from typing import Any
 
+from app.config import get_settings
 from app.core.utils import create_id
-from app.jobs.schemas import IntermediateResult, JobResponse, JobStatus
+from app.jobs.schemas import IntermediateResult, JobProgress, JobResponse, JobStatus
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached results of pure handlers
+RESULT_CACHE_SIZE = 512
+
+# Maximum number of cleaned up Job objects kept for reuse
+JOB_POOL_SIZE = 1024
+
+
+def _to_datetime(timestamp: float | None) -> datetime | None:
+    """Convert an epoch timestamp to a local datetime.
+
+    Args:
+        timestamp: Epoch seconds or None
+
+    Returns:
+        The datetime or None
+    """
+    return datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
 
 class Job:
     """Internal job representation."""
 
-    def __init__(self, job_id: str, job_type: str, payload: dict[str, Any]) -> None:
+    __slots__ = (
+        "_cached_response",
+        "completed_at",
+        "completed_mono",
+        "created_at",
+        "error",
+        "final_result",
+        "id",
+        "idempotency_key",
+        "intermediate_results",
+        "payload",
+        "progress",
+        "started_at",
+        "status",
+        "type",
+        "version",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        job_type: str,
+        payload: dict[str, Any],
+        max_intermediate_results: int | None = None,
+    ) -> None:
         """Initialize a job.
 
+        Args:
+            job_id: Unique job identifier
+            job_type: Type of job (handler identifier)
+            payload: Job-specific data
+            max_intermediate_results: Keep only the most recent N intermediate
+                results (None keeps all)
+        """
+        # (timestamp, data) pairs; oldest entries are dropped once maxlen is reached
+        self.intermediate_results: deque[tuple[float, Any]] = deque(
+            maxlen=max_intermediate_results
+        )
+        self._reset(job_id, job_type, payload)
+
+    def _reset(self, job_id: str, job_type: str, payload: dict[str, Any]) -> None:
+        """Reset all job state, so a cleaned up job object can be reused.
+
         Args:
             job_id: Unique job identifier
             job_type: Type of job (handler identifier)
@@ -26,40 +90,98 @@ class Job:
         self.type = job_type
         self.payload = payload
         self.status = JobStatus.PENDING
-        self.created_at = datetime.now()
-        self.started_at: datetime | None = None
-        self.completed_at: datetime | None = None
-        self.intermediate_results: list[IntermediateResult] = []
+        # Timestamps are raw epoch seconds, converted to datetime only for responses
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.completed_at: float | None = None
+        # Monotonic completion time, for retention (immune to wall clock changes)
+        self.completed_mono: float | None = None
+        self.intermediate_results.clear()
+        self.progress: tuple[int, int] | None = None  # (current, total)
         self.final_result: Any | None = None
         self.error: str | None = None
+        self.idempotency_key: str | None = None
+        self.version = 0  # Bumped on every state change, used as ETag
+        self._cached_response: tuple[int, JobResponse] | None = None  # (version, ...)
+
+    @property
+    def etag(self) -> str:
+        """Weak ETag identifying the current job state."""
+        return f'W/"{self.version}"'
 
     def to_response(self) -> JobResponse:
         """Convert to response schema.
 
+        The response is built once per state version and reused for every
+        poll until the job changes again. Fields come from trusted internal
+        state, so the response is constructed without validation.
+
         Returns:
             JobResponse schema
         """
-        return JobResponse(
+        cached = self._cached_response
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        response = JobResponse.model_construct(
             id=self.id,
             type=self.type,
-            status=self.status,
-            created_at=self.created_at,
-            started_at=self.started_at,
-            completed_at=self.completed_at,
-            intermediate_results=self.intermediate_results,
+            status=self.status.value,  # as stored with use_enum_values
+            created_at=_to_datetime(self.created_at),
+            started_at=_to_datetime(self.started_at),
+            completed_at=_to_datetime(self.completed_at),
+            intermediate_results=[
+                IntermediateResult.model_construct(
+                    timestamp=_to_datetime(timestamp), data=data
+                )
+                for timestamp, data in self.intermediate_results
+            ],
+            progress=self._progress_response(),
             final_result=self.final_result,
             error=self.error,
         )
 
+        self._cached_response = (self.version, response)
+        return response
+
+    def _progress_response(self) -> JobProgress | None:
+        """Build the progress schema from the stored counters.
+
+        Returns:
+            JobProgress or None if no progress was reported
+        """
+        if self.progress is None:
+            return None
+
+        current, total = self.progress
+        percent = int(current / total * 100) if total else 0
+        return JobProgress.model_construct(
+            current=current, total=total, percent=percent
+        )
+
 
 class JobManager:
     """Manages job queue and storage."""
 
-    def __init__(self) -> None:
-        """Initialize the job manager."""
+    def __init__(self, max_intermediate_results: int | None = None) -> None:
+        """Initialize the job manager.
+
+        Args:
+            max_intermediate_results: Per-job cap on retained intermediate
+                results (None keeps all)
+        """
+        self._max_intermediate_results = max_intermediate_results
         self._jobs: dict[str, Job] = {}
-        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._jobs_get = self._jobs.get  # bound once, used on every job update
+        self._queue: deque[str] = deque()
+        self._waiters: deque[asyncio.Future[str]] = deque()  # idle workers
         self._idempotency_keys: dict[str, str] = {}  # idempotency_key -> job_id
+        # Min-heap of (completed_mono, job_id)
+        self._expiry: list[tuple[float, str]] = []
+        self._result_cache: OrderedDict[Hashable, Any] = OrderedDict()  # LRU order
+        # Number of stored jobs per status, kept in step with every transition
+        self._status_counts: dict[JobStatus, int] = dict.fromkeys(JobStatus, 0)
+        self._job_pool: deque[Job] = deque()  # cleaned up jobs, ready for reuse
         logger.info("Job manager initialized")
 
     async def submit_job(
@@ -79,38 +201,94 @@ class JobManager:
         if idempotency_key:
             existing_job_id = self._idempotency_keys.get(idempotency_key)
             if existing_job_id:
-                existing_job = self._jobs.get(existing_job_id)
+                existing_job = self._jobs_get(existing_job_id)
                 if existing_job:
                     # Job still exists, return existing job
                     logger.info(
-                        f"Idempotent request: returning existing job {existing_job_id} "
-                        f"(key: {idempotency_key})"
+                        "Idempotent request: returning existing job %s (key: %s)",
+                        existing_job_id,
+                        idempotency_key,
                     )
                     return existing_job_id, False
                 else:
                     # Job was cleaned up, remove stale idempotency key
                     del self._idempotency_keys[idempotency_key]
 
-        # Create new job
-        job_id = create_id()
-        job = Job(job_id, job_type, payload)
-
-        # Store in memory
-        self._jobs[job_id] = job
+        # Create and store new job
+        job = self._create_job(job_type, payload)
+        job_id = job.id
 
         # Store idempotency key mapping
         if idempotency_key:
+            job.idempotency_key = idempotency_key
             self._idempotency_keys[idempotency_key] = job_id
 
-        # Add to queue
-        await self._queue.put(job_id)
+        # Hand to an idle worker or add to queue
+        self._dispatch(job_id)
 
-        logger.info(
-            f"Job submitted: {job_id} (type: {job_type})"
-            + (f" (idempotency_key: {idempotency_key})" if idempotency_key else "")
-        )
+        if idempotency_key:
+            logger.info(
+                "Job submitted: %s (type: %s) (idempotency_key: %s)",
+                job_id,
+                job_type,
+                idempotency_key,
+            )
+        else:
+            logger.info("Job submitted: %s (type: %s)", job_id, job_type)
         return job_id, True
 
+    async def submit_job_many(
+        self, jobs: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[str]:
+        """Submit several jobs at once.
+
+        Idle workers are handed one job each and the rest are queued in a
+        single step, instead of dispatching job by job.
+
+        Args:
+            jobs: (job_type, payload) pairs
+
+        Returns:
+            The new job IDs, in submission order
+        """
+        job_ids = [self._create_job(job_type, payload).id for job_type, payload in jobs]
+
+        # Hand to idle workers, queue the remainder
+        waiters = self._waiters
+        for index, job_id in enumerate(job_ids):
+            while waiters and waiters[0].done():
+                waiters.popleft()
+            if not waiters:
+                self._queue.extend(job_ids[index:])
+                break
+            waiters.popleft().set_result(job_id)
+
+        logger.info("Jobs submitted: %d", len(job_ids))
+        return job_ids
+
+    def _create_job(self, job_type: str, payload: dict[str, Any]) -> Job:
+        """Create a pending job and add it to storage.
+
+        Args:
+            job_type: The type of job to execute
+            payload: Job-specific data
+
+        Returns:
+            The new job
+        """
+        # Share one string object per job type
+        job_type = sys.intern(job_type)
+        job_id = create_id()
+        if self._job_pool:
+            job = self._job_pool.pop()
+            job._reset(job_id, job_type, payload)
+        else:
+            job = Job(job_id, job_type, payload, self._max_intermediate_results)
+
+        self._jobs[job_id] = job
+        self._status_counts[JobStatus.PENDING] += 1
+        return job
+
     def get_job(self, job_id: str) -> Job | None:
         """Get a job by ID.
 
@@ -120,7 +298,7 @@ class JobManager:
         Returns:
             The Job object or None if not found
         """
-        return self._jobs.get(job_id, None)
+        return self._jobs_get(job_id)
 
     def get_job_response(self, job_id: str) -> JobResponse | None:
         """Get a job response by ID.
@@ -140,7 +318,40 @@ class JobManager:
         Returns:
             The next job ID
         """
-        return await self._queue.get()
+        if self._queue:
+            return self._queue.popleft()
+
+        # Idle: wait until submit_job hands a job directly to this worker
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # Don't lose a job that was handed over right before cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._dispatch(waiter.result(), front=True)
+            raise
+
+    def _dispatch(self, job_id: str, front: bool = False) -> None:
+        """Hand a job to one idle worker, or queue it if all workers are busy.
+
+        Waking exactly one waiter per job avoids rousing every idle worker
+        only for all but one to go back to sleep.
+
+        Args:
+            job_id: The job identifier
+            front: Queue at the front (for jobs that were already dequeued)
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(job_id)
+                return
+
+        if front:
+            self._queue.appendleft(job_id)
+        else:
+            self._queue.append(job_id)
 
     def update_job_status(self, job_id: str, status: JobStatus) -> None:
         """Update job status.
@@ -149,16 +360,55 @@ class JobManager:
             job_id: The job identifier
             status: New status
         """
-        job = self._jobs.get(job_id)
+        job = self._jobs_get(job_id)
         if job:
+            self._status_counts[job.status] -= 1
+            self._status_counts[status] += 1
             job.status = status
+            job.version += 1
+
+            # Enum members are singletons, so identity checks suffice
+            if status is JobStatus.RUNNING and job.started_at is None:
+                job.started_at = time.time()
+            elif status is JobStatus.COMPLETED or status is JobStatus.FAILED:
+                job.completed_at = time.time()
+                job.completed_mono = time.monotonic()
+                heapq.heappush(self._expiry, (job.completed_mono, job_id))
+
+            logger.info("Job %s: Status updated to %s", job_id, status)
+
+    def finalize(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        result: Any | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Finish a job, storing its outcome and terminal status in one step.
 
-            if status == JobStatus.RUNNING and not job.started_at:
-                job.started_at = datetime.now()
-            elif status in (JobStatus.COMPLETED, JobStatus.FAILED):
-                job.completed_at = datetime.now()
+        Args:
+            job_id: The job identifier
+            status: Terminal status (COMPLETED or FAILED)
+            result: The final result data
+            error: The error message
+        """
+        job = self._jobs_get(job_id)
+        if job:
+            job.final_result = result
+            job.error = error
+            self._status_counts[job.status] -= 1
+            self._status_counts[status] += 1
+            job.status = status
+            job.completed_at = time.time()
+            job.completed_mono = time.monotonic()
+            job.version += 1
+            heapq.heappush(self._expiry, (job.completed_mono, job_id))
 
-            logger.info(f"Job {job_id}: Status updated to {status}")
+            if error is None:
+                logger.info("Job %s: Finished with status %s", job_id, status)
+            else:
+                logger.error("Job %s: Failed - %s", job_id, error)
 
     def set_job_result(self, job_id: str, result: Any) -> None:
         """Set the final result for a job.
@@ -167,10 +417,11 @@ class JobManager:
             job_id: The job identifier
             result: The final result data
         """
-        job = self._jobs.get(job_id)
+        job = self._jobs_get(job_id)
         if job:
             job.final_result = result
-            logger.info(f"Job {job_id}: Final result set")
+            job.version += 1
+            logger.info("Job %s: Final result set", job_id)
 
     def set_job_error(self, job_id: str, error: str) -> None:
         """Set an error message for a job.
@@ -179,10 +430,11 @@ class JobManager:
             job_id: The job identifier
             error: The error message
         """
-        job = self._jobs.get(job_id)
+        job = self._jobs_get(job_id)
         if job:
             job.error = error
-            logger.error(f"Job {job_id}: Error - {error}")
+            job.version += 1
+            logger.error("Job %s: Error - %s", job_id, error)
 
     def add_intermediate_result(self, job_id: str, data: Any) -> None:
         """Add an intermediate result to a job.
@@ -191,11 +443,66 @@ class JobManager:
             job_id: The job identifier
             data: The intermediate result data
         """
-        job = self._jobs.get(job_id)
+        job = self._jobs_get(job_id)
         if job:
-            intermediate = IntermediateResult(timestamp=datetime.now(), data=data)
-            job.intermediate_results.append(intermediate)
-            logger.debug(f"Job {job_id}: Intermediate result added")
+            job.intermediate_results.append((time.time(), data))
+            job.version += 1
+            logger.debug("Job %s: Intermediate result added", job_id)
+
+    def add_intermediate_results(
+        self, job_id: str, results: list[tuple[float, Any]]
+    ) -> None:
+        """Add a batch of timestamped intermediate results to a job.
+
+        Args:
+            job_id: The job identifier
+            results: (timestamp, data) pairs in the order they were produced
+        """
+        job = self._jobs_get(job_id)
+        if job:
+            job.intermediate_results.extend(results)
+            job.version += 1
+            logger.debug("Job %s: %d intermediate results added", job_id, len(results))
+
+    def set_job_progress(self, job_id: str, current: int, total: int) -> None:
+        """Set the progress of a job, replacing the previous value.
+
+        Args:
+            job_id: The job identifier
+            current: Completed units of work
+            total: Total units of work
+        """
+        job = self._jobs_get(job_id)
+        if job:
+            job.progress = (current, total)
+            job.version += 1
+
+    def get_cached_result(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a cached handler result.
+
+        Args:
+            key: The cache key (job type and frozen payload)
+
+        Returns:
+            Tuple of (found, result)
+        """
+        if key not in self._result_cache:
+            return False, None
+
+        self._result_cache.move_to_end(key)
+        return True, self._result_cache[key]
+
+    def cache_result(self, key: Hashable, result: Any) -> None:
+        """Cache a handler result, evicting the least recently used entry.
+
+        Args:
+            key: The cache key (job type and frozen payload)
+            result: The final result to cache
+        """
+        self._result_cache[key] = result
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     def get_queue_size(self) -> int:
         """Get the current queue size.
@@ -203,7 +510,7 @@ class JobManager:
         Returns:
             Number of jobs in queue
         """
-        return self._queue.qsize()
+        return len(self._queue)
 
     def get_job_count(self) -> int:
         """Get total number of jobs.
@@ -216,44 +523,49 @@ class JobManager:
     def cleanup_old_jobs(self, retention_seconds: int) -> int:
         """Remove completed/failed jobs older than retention period.
 
+        Only jobs whose expiry entry has come due are visited, so the cost is
+        proportional to the number of jobs removed, not the number stored.
+
         Args:
             retention_seconds: How long to keep completed jobs (in seconds)
 
         Returns:
             Number of jobs removed
         """
-        cutoff_time = datetime.now() - timedelta(seconds=retention_seconds)
-        jobs_to_remove = []
+        cutoff_time = time.monotonic() - retention_seconds
+        expiry = self._expiry
+        removed = 0
 
-        for job_id, job in self._jobs.items():
-            # Only cleanup completed or failed jobs
-            if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED):
-                continue
+        while expiry and expiry[0][0] < cutoff_time:
+            completed_mono, job_id = heapq.heappop(expiry)
 
-            # Check if job is old enough to remove
-            if job.completed_at and job.completed_at < cutoff_time:
-                jobs_to_remove.append(job_id)
+            # Skip stale entries (job already removed or completed again later)
+            job = self._jobs_get(job_id)
+            if not job or job.completed_mono != completed_mono:
+                continue
 
-        # Remove old jobs and their idempotency keys
-        for job_id in jobs_to_remove:
+            # Remove old job and its idempotency key
             del self._jobs[job_id]
+            self._status_counts[job.status] -= 1
+            if self._idempotency_keys.get(job.idempotency_key) == job_id:
+                del self._idempotency_keys[job.idempotency_key]
 
-            # Remove associated idempotency key
-            keys_to_remove = [
-                key for key, jid in self._idempotency_keys.items() if jid == job_id
-            ]
-            for key in keys_to_remove:
-                del self._idempotency_keys[key]
+            # Keep the object for a future job, dropping references to old data
+            if len(self._job_pool) < JOB_POOL_SIZE:
+                job.payload = job.final_result = None
+                job.intermediate_results.clear()
+                job._cached_response = None
+                self._job_pool.append(job)
 
-            logger.debug(f"Cleaned up old job: {job_id}")
+            removed += 1
+            logger.debug("Cleaned up old job: %s", job_id)
 
-        if jobs_to_remove:
+        if removed:
             logger.info(
-                f"Cleaned up {len(jobs_to_remove)} old jobs "
-                f"(retention: {retention_seconds}s)"
+                "Cleaned up %d old jobs (retention: %ss)", removed, retention_seconds
             )
 
-        return len(jobs_to_remove)
+        return removed
 
     def get_job_count_by_status(self, status: JobStatus) -> int:
         """Count jobs with a specific status.
@@ -264,8 +576,8 @@ class JobManager:
         Returns:
             Number of jobs with the given status
         """
-        return sum(1 for job in self._jobs.values() if job.status == status)
+        return self._status_counts[status]
 
 
 # Global job manager instance
-job_manager = JobManager()
+job_manager = JobManager(get_settings().max_intermediate_results)
@@ -1,7 +1,9 @@
 """Job handler registry and execution context."""
 
+import inspect
 import logging
-from typing import Any, Callable
+import sys
+from typing import Any, Callable, Literal
 
 from app.jobs.base import JobContext
 
@@ -12,16 +14,39 @@ JobHandler = Callable[[JobContext, dict], Any]
 # Global handler registry
 _registry: dict[str, JobHandler] = {}
 
+# Snapshot of registered job types for fast membership tests, rebuilt on registration
+_job_types: frozenset[str] = frozenset()
 
-def register_handler(job_type: str) -> Callable:
+# Job types whose handlers always return the same result for the same payload
+_pure_job_types: set[str] = set()
+
+# Job types whose (synchronous) handlers run in the shared process pool
+_process_job_types: set[str] = set()
+
+
+def register_handler(
+    job_type: str, pure: bool = False, executor: Literal["process"] | None = None
+) -> Callable:
     """Decorator to register a job handler for a specific job type.
 
     Args:
         job_type: The job type identifier
+        pure: Whether the handler's result depends only on its payload, which
+            allows the worker to reuse cached results for repeated payloads
+        executor: "process" to run a CPU-bound handler in a separate process so
+            it does not block the event loop. Such handlers are plain
+            (non-async) module-level functions taking only the payload, and
+            cannot publish intermediate results.
 
     Returns:
         Decorator function
 
+    Raises:
+        RuntimeError: If a handler is already registered for the job type
+        TypeError: If the handler is async for executor="process", or not async
+            otherwise
+        ValueError: If the executor is not supported
+
     Example:
         @register_handler("email_send")
         async def send_email_handler(payload: dict, context: JobContext) -> dict:
@@ -29,11 +54,38 @@ def register_handler(job_type: str) -> Callable:
             context.add_result({"status": "sending"})
             # ... send email ...
             return {"sent": True, "message_id": "123"}
+
+        @register_handler("report", executor="process")
+        def build_report_handler(payload: dict) -> dict:
+            return {"rows": crunch_numbers(payload["data"])}
     """
+    if executor not in (None, "process"):
+        raise ValueError(f"Unsupported handler executor: {executor}")
 
     def decorator(func: Callable) -> Callable:
-        _registry[job_type] = func
-        logger.info(f"Registered handler for job type: {job_type}")
+        global _job_types
+
+        # Fail fast instead of letting the last import silently win
+        if job_type in _registry:
+            raise RuntimeError(f"Handler already registered for job type: {job_type}")
+
+        # Catch handlers that could only ever fail at run time
+        is_async = inspect.iscoroutinefunction(func)
+        if executor == "process" and is_async:
+            raise TypeError(
+                f"Handler for job type {job_type} must not be async with "
+                'executor="process"'
+            )
+        if executor is None and not is_async:
+            raise TypeError(f"Handler for job type {job_type} must be async")
+
+        _registry[sys.intern(job_type)] = func
+        _job_types = frozenset(_registry)
+        if pure:
+            _pure_job_types.add(job_type)
+        if executor == "process":
+            _process_job_types.add(job_type)
+        logger.info("Registered handler for job type: %s", job_type)
         return func
 
     return decorator
@@ -47,7 +99,31 @@ def can_handle(job_type: str) -> bool:
     Returns:
         True if the job type can be handled; false otherwise
     """
-    return job_type in _registry
+    return job_type in _job_types
+
+
+def is_pure(job_type: str) -> bool:
+    """Check if results of a job type may be cached by payload.
+
+    Args:
+        job_type: The job type identifier
+
+    Returns:
+        True if the handler was registered as pure; false otherwise
+    """
+    return job_type in _pure_job_types
+
+
+def runs_in_process(job_type: str) -> bool:
+    """Check if a job type's handler runs in the process pool.
+
+    Args:
+        job_type: The job type identifier
+
+    Returns:
+        True if the handler was registered with executor="process"; false otherwise
+    """
+    return job_type in _process_job_types
 
 
 def get_handler(job_type: str) -> Callable | None:
@@ -4,39 +4,31 @@ This module automatically collects all request schemas defined in handler module
 and creates a discriminated union for FastAPI endpoints.
 """
 
+from functools import cache
 from typing import Annotated, Union
 
 from pydantic import Field
 
-from app.jobs.schemas import BaseJobRequest
+from app.jobs.schemas import BaseJobRequest, freeze_request_types
 
 
-def get_all_request_types() -> list[type[BaseJobRequest]]:
+def get_all_request_types() -> tuple[type[BaseJobRequest], ...]:
     """Discover all job request types from handler modules.
 
+    Request types record themselves when their class is defined (see
+    BaseJobRequest.__pydantic_init_subclass__), so no class hierarchy walk
+    is needed. Request types defined after this call raise RuntimeError,
+    since they could no longer be added to the union.
+
     Returns:
-        List of all request type classes that inherit from BaseJobRequest
+        All request type classes that inherit from BaseJobRequest
     """
     import app.handlers  # noqa: F401 - Import to trigger handler registration
 
-    # Collect all BaseJobRequest subclasses
-    request_types: list[type[BaseJobRequest]] = []
-
-    def collect_subclasses(cls: type) -> None:
-        """Recursively collect all subclasses."""
-        for subclass in cls.__subclasses__():
-            # Only include concrete request classes (not base classes)
-            if (
-                subclass.__name__ != "BaseJobRequest"
-                and not subclass.__name__.startswith("_")
-            ):
-                request_types.append(subclass)
-            collect_subclasses(subclass)
-
-    collect_subclasses(BaseJobRequest)
-    return request_types
+    return freeze_request_types()
 
 
+@cache
 def create_job_request_union() -> type:
     """Create a discriminated union of all job request types.
 
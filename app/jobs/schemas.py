@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, Enum):
@@ -32,6 +32,44 @@ class BaseJobRequest(BaseModel):
         max_length=255,
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Record concrete request types as their classes are defined.
+
+        Raises:
+            RuntimeError: If the request types were already frozen
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Only include concrete request classes (not base classes)
+        if cls.__name__ != "BaseJobRequest" and not cls.__name__.startswith("_"):
+            # Fail fast instead of silently leaving the type out of the union
+            if _request_types_frozen:
+                raise RuntimeError(
+                    f"Job request type {cls.__name__} defined after the job "
+                    "request union was built"
+                )
+            _request_types.append(cls)
+
+
+# Concrete BaseJobRequest subclasses in definition order, filled in as they are defined
+_request_types: list[type[BaseJobRequest]] = []
+
+# Set once the request types were handed out; no new ones are accepted after that
+_request_types_frozen = False
+
+
+def freeze_request_types() -> tuple[type[BaseJobRequest], ...]:
+    """Get all concrete job request types and stop accepting new ones.
+
+    Returns:
+        The request types in definition order
+    """
+    global _request_types_frozen
+
+    _request_types_frozen = True
+    return tuple(_request_types)
+
 
 class IntermediateResult(BaseModel):
     """Schema for intermediate job results."""
@@ -40,9 +78,19 @@ class IntermediateResult(BaseModel):
     data: Any
 
 
+class JobProgress(BaseModel):
+    """Schema for job progress."""
+
+    current: int = Field(..., description="Completed units of work")
+    total: int = Field(..., description="Total units of work")
+    percent: int = Field(..., description="Completed share in percent")
+
+
 class JobResponse(BaseModel):
     """Schema for job status response."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     id: str = Field(..., description="Unique job identifier")
     type: str = Field(..., description="Job type")
     status: JobStatus = Field(..., description="Current job status")
@@ -54,12 +102,10 @@ class JobResponse(BaseModel):
     intermediate_results: list[IntermediateResult] = Field(
         default_factory=list, description="Intermediate results during job execution"
     )
+    progress: JobProgress | None = Field(
+        None, description="Latest progress reported by the handler"
+    )
     final_result: Any | None = Field(
         None, description="Final result after job completion"
     )
     error: str | None = Field(None, description="Error message if job failed")
-
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
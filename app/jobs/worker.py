@@ -2,14 +2,67 @@
 
 import asyncio
 import logging
-
-from app.jobs.registry import get_handler
+import multiprocessing
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from app.config import get_settings
+from app.core.logging import setup_process_logging
+from app.core.utils import freeze
+from app.jobs.registry import get_handler, is_pure, runs_in_process
 from app.jobs.base import JobContext
 from app.jobs.manager import JobManager
 from app.jobs.schemas import JobStatus
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for cancelled workers to finish before giving up on them
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+
+# Shared pool for CPU-bound handlers, created on first use
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use.
+
+    Returns:
+        The process pool executor
+    """
+    global _process_pool
+
+    if _process_pool is None:
+        # Spawn fresh interpreters rather than forking this multi-threaded
+        # process, and give them their own logging (the parent's queue
+        # listener thread does not exist in a child)
+        _process_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_process_logging,
+            initargs=(get_settings().log_level,),
+        )
+        logger.info("Started process pool for CPU-bound handlers")
+
+    return _process_pool
+
+
+def _result_cache_key(job_type: str, payload: dict[str, Any]) -> Hashable | None:
+    """Build the result cache key for a job.
+
+    Args:
+        job_type: The job type
+        payload: The job payload
+
+    Returns:
+        The cache key, or None if the payload contains unhashable values
+    """
+    key = (job_type, freeze(payload))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 async def process_job(job_manager: JobManager, job_id: str) -> None:
     """Process a single job.
@@ -20,10 +73,10 @@ async def process_job(job_manager: JobManager, job_id: str) -> None:
     """
     job = job_manager.get_job(job_id)
     if not job:
-        logger.error(f"Job {job_id} not found in storage")
+        logger.error("Job %s not found in storage", job_id)
         return
 
-    logger.info(f"Processing job {job_id} (type: {job.type})")
+    logger.info("Processing job %s (type: %s)", job_id, job.type)
 
     # Update status to running
     job_manager.update_job_status(job_id, JobStatus.RUNNING)
@@ -34,25 +87,48 @@ async def process_job(job_manager: JobManager, job_id: str) -> None:
         if not handler:
             raise ValueError(f"No handler registered for job type: {job.type}")
 
-        # Create job context
-        context = JobContext(job_id, job_manager)
-
-        # Execute the handler
-        result = await handler(job.payload, context)
+        # Pure handlers return the same result for the same payload
+        cache_key = None
+        if is_pure(job.type):
+            cache_key = _result_cache_key(job.type, job.payload)
+
+        if cache_key is not None:
+            found, result = job_manager.get_cached_result(cache_key)
+            if found:
+                job_manager.finalize(job_id, JobStatus.COMPLETED, result=result)
+                logger.info("Job %s completed from result cache", job_id)
+                return
+
+        if runs_in_process(job.type):
+            # Execute the CPU-bound handler without blocking the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                _get_process_pool(), handler, job.payload
+            )
+        else:
+            # Create job context
+            context = JobContext(job_id, job_manager)
+
+            # Execute the handler
+            try:
+                result = await handler(job.payload, context)
+            finally:
+                # Publish buffered intermediate results, also if the handler failed
+                context.flush()
 
         # Store final result
-        job_manager.set_job_result(job_id, result)
-        job_manager.update_job_status(job_id, JobStatus.COMPLETED)
+        if cache_key is not None:
+            job_manager.cache_result(cache_key, result)
+        job_manager.finalize(job_id, JobStatus.COMPLETED, result=result)
 
-        logger.info(f"Job {job_id} completed successfully")
+        logger.info("Job %s completed successfully", job_id)
 
     except Exception as e:
         # Handle errors
         error_msg = f"{type(e).__name__}: {e!s}"
-        job_manager.set_job_error(job_id, error_msg)
-        job_manager.update_job_status(job_id, JobStatus.FAILED)
+        job_manager.finalize(job_id, JobStatus.FAILED, error=error_msg)
 
-        logger.exception(f"Job {job_id} failed with error: {error_msg}")
+        logger.exception("Job %s failed with error: %s", job_id, error_msg)
 
 
 async def worker_loop(worker_id: int, job_manager: JobManager) -> None:
@@ -62,23 +138,26 @@ async def worker_loop(worker_id: int, job_manager: JobManager) -> None:
         worker_id: Unique identifier for this worker
         job_manager: The job manager instance
     """
-    logger.info(f"Worker {worker_id} started")
+    logger.info("Worker %d started", worker_id)
+
+    # Resolve the bound method once instead of on every iteration
+    get_next_job = job_manager.get_next_job
 
     try:
         while True:
             # Get next job from queue (blocking)
-            job_id = await job_manager.get_next_job()
+            job_id = await get_next_job()
 
-            logger.debug(f"Worker {worker_id} picked up job {job_id}")
+            logger.debug("Worker %d picked up job %s", worker_id, job_id)
 
             # Process the job
             await process_job(job_manager, job_id)
 
     except asyncio.CancelledError:
-        logger.info(f"Worker {worker_id} shutting down")
+        logger.info("Worker %d shutting down", worker_id)
         raise
     except Exception as e:
-        logger.exception(f"Worker {worker_id} encountered unexpected error: {e}")
+        logger.exception("Worker %d encountered unexpected error: %s", worker_id, e)
         raise
 
 
@@ -97,7 +176,7 @@ async def start_workers(
     if worker_count == 0:
         return None
 
-    logger.info(f"Starting {worker_count} workers")
+    logger.info("Starting %d workers", worker_count)
 
     workers = []
     for i in range(worker_count):
@@ -113,13 +192,27 @@ async def stop_workers(workers: list[asyncio.Task]) -> None:
     Args:
         workers: List of worker tasks to stop
     """
-    logger.info(f"Stopping {len(workers)} workers")
+    global _process_pool
+
+    logger.info("Stopping %d workers", len(workers))
 
     # Cancel all workers
     for worker in workers:
         worker.cancel()
 
-    # Wait for them to finish
-    await asyncio.gather(*workers, return_exceptions=True)
+    # Wait for them to finish, but don't let a stuck handler block shutdown
+    if workers:
+        _, pending = await asyncio.wait(workers, timeout=WORKER_SHUTDOWN_TIMEOUT)
+        if pending:
+            logger.warning(
+                "%d workers did not stop within %ss",
+                len(pending),
+                WORKER_SHUTDOWN_TIMEOUT,
+            )
+
+    # Stop the process pool, dropping handler calls that have not started yet
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
 
     logger.info("All workers stopped")
@@ -1,31 +1,49 @@
+import logging
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import logger
-from app.middleware.utils import Colors, get_method_color, get_status_color
+from app.middleware.utils import get_method_prefix, get_status_prefix
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all incoming requests, the response status code and their processing time."""
+class RequestLoggingMiddleware:
+    """Middleware to log all incoming requests, the response status code and their processing time.
 
-    async def dispatch(self, request: Request, call_next):
-        start = time.perf_counter()
+    Implemented as plain ASGI middleware to avoid the per-request task and stream
+    wrapping overhead of Starlette's BaseHTTPMiddleware.
+    """
 
-        # Process request
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
 
-        # Calculate processing time
-        process_time = int((time.perf_counter() - start) * 1000 * 1000 * 1000) / 1000
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time (whole µs, integer math only)
+                process_time = (time.perf_counter_ns() - start) // 1000
 
-        # Log response
-        short_method = request.method[:5] if request.method != "OPTIONS" else "OPT.."
-        logger.info(
-            f"| {get_status_color(response.status_code)}{response.status_code}{Colors.Reset} | {process_time:>13}µs | {get_method_color(request.method)}{short_method:<5}{Colors.Reset} | {request.url.path}"
-        )
+                # Log response
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "| %s | %13dµs | %s | %s",
+                        get_status_prefix(message["status"]),
+                        process_time,
+                        get_method_prefix(scope["method"]),
+                        scope["path"],
+                    )
 
-        # Add custom header with processing time
-        response.headers["X-Process-Time"] = f"{process_time}"
+                # Add custom header with processing time
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time}"
 
-        return response
+            await send(message)
+
+        # Process request
+        await self.app(scope, receive, send_with_timing)
@@ -10,23 +10,51 @@ class Colors:
     Reset = "\u001b[0m"
 
 
+# Lookup tables are built once at import instead of on every call
+_STATUS_COLORS = {
+    2: Colors.Green,
+    3: Colors.Blue,
+    4: Colors.Yellow,
+    5: Colors.Red,
+}
+
+_METHOD_COLORS = {
+    "GET": Colors.Cyan,
+    "POST": Colors.Green,
+    "PUT": Colors.Yellow,
+    "PATCH": Colors.White,
+    "DELETE": Colors.Red,
+    "OPTIONS": Colors.Black,
+    "HEAD": Colors.Magenta,
+}
+
+
 def get_status_color(status_code: int) -> str:
-    status_class = status_code // 100
-    return {
-        2: Colors.Green,
-        3: Colors.Blue,
-        4: Colors.Yellow,
-        5: Colors.Red,
-    }.get(status_class, Colors.White)
+    return _STATUS_COLORS.get(status_code // 100, Colors.White)
 
 
 def get_method_color(method: str) -> str:
-    return {
-        "GET": Colors.Cyan,
-        "POST": Colors.Green,
-        "PUT": Colors.Yellow,
-        "PATCH": Colors.White,
-        "DELETE": Colors.Red,
-        "OPTIONS": Colors.Black,
-        "HEAD": Colors.Magenta,
-    }.get(method.upper(), Colors.White)
+    # ASGI servers pass the method in upper case
+    return _METHOD_COLORS.get(method, Colors.White)
+
+
+def _format_status(status_code: int) -> str:
+    return f"{get_status_color(status_code)}{status_code}{Colors.Reset}"
+
+
+def _format_method(method: str) -> str:
+    short_method = method[:5] if method != "OPTIONS" else "OPT.."
+    return f"{get_method_color(method)}{short_method:<5}{Colors.Reset}"
+
+
+# Fully colored log fragments for all standard status codes and methods
+_STATUS_PREFIXES = {code: _format_status(code) for code in range(100, 600)}
+_METHOD_PREFIXES = {method: _format_method(method) for method in _METHOD_COLORS}
+
+
+def get_status_prefix(status_code: int) -> str:
+    return _STATUS_PREFIXES.get(status_code) or _format_status(status_code)
+
+
+def get_method_prefix(method: str) -> str:
+    return _METHOD_PREFIXES.get(method) or _format_method(method)